@@ -54,8 +54,10 @@ def create_query_validation_exception(field: str, msg: str) -> HTTPException:
 def pagination_factory(max_limit: Optional[int] = None) -> Any:
     """
     Creates the pagination dependency to be used in the router.
+    The dependency only validates values, so it is async to avoid a
+    threadpool hop per request.
     """
-    def pagination(skip: int = 0, limit: Optional[int] = max_limit) -> PAGINATION:
+    async def pagination(skip: int = 0, limit: Optional[int] = max_limit) -> PAGINATION:
         if skip < 0:
             raise create_query_validation_exception(
                 field="skip",
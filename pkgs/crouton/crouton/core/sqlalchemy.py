@@ -1,36 +1,127 @@
-from typing import Any, Callable, List, Type, Generator, Optional, Union, Dict
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from . import CRUDGenerator, NOT_FOUND, _utils
 from ._types import DEPENDENCIES, PAGINATION, PYDANTIC_SCHEMA as SCHEMA
 
 try:
-    from sqlalchemy.orm import Session
+    from sqlalchemy import Integer, bindparam, delete, select, update
+    from sqlalchemy.sql import Select
+    from sqlalchemy.orm import Session, raiseload, scoped_session, selectinload
     from sqlalchemy.ext.declarative import DeclarativeMeta as Model
     from sqlalchemy.exc import IntegrityError
 except ImportError:
     Model = None
+    Select = None
     Session = None
+    OrmSession = None
+    scoped_session = None
     IntegrityError = None
     sqlalchemy_installed = False
 else:
     sqlalchemy_installed = True
+    OrmSession = Session
     Session = Callable[..., Generator[Session, Any, None]]
 
 CALLABLE = Callable[..., Model]
 CALLABLE_LIST = Callable[..., List[Model]]
 
+# SQLSTATE for unique_violation, with a message fallback for drivers that
+# do not expose one (e.g. sqlite3)
+_UNIQUE_SQLSTATE = "23505"
+_UNIQUE_RE = re.compile(r"unique|duplicate", re.I)
+
 
 # Utility function for extracting query parameters
-def query_params(request: Request) -> Dict[str, Any]:
+async def query_params(request: Request) -> Dict[str, Any]:
     """
     Extract query parameters from the incoming request
-    and return them as a dictionary.
+    and return them as a dictionary. This does no I/O, so it is declared
+    async to run on the event loop instead of FastAPI's threadpool.
     """
     return dict(request.query_params)
 
 
+def _session_dependency(
+    session_factory: Callable[[], "OrmSession"],
+) -> Callable[[], Generator["OrmSession", None, None]]:
+    """
+    Turn a session factory into a dependency that opens one session per
+    request and returns its connection to the pool once the response is sent.
+    """
+
+    def get_db() -> Generator["OrmSession", None, None]:
+        session = session_factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return get_db
+
+
 class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
+    """
+    CRUD router for SQLAlchemy models.
+
+    The routes execute 2.0 style ``select()`` statements whose filter values
+    are passed as bound parameters, so SQLAlchemy's compiled-statement cache
+    only has to compile each query shape once. The cache lives on the engine
+    behind ``db``; keep it enabled and sized for the number of routers, e.g.
+    ``create_engine(url, query_cache_size=1200)``. Setting
+    ``query_cache_size=0`` makes every request recompile its SQL.
+
+    Relationships named in ``eager_load`` are loaded with ``selectinload`` by
+    the get routes, so serializing a nested schema costs one extra SELECT per
+    relationship instead of one per row. ``strict_loading`` adds
+    ``raiseload("*")`` so any other lazy load raises instead of silently
+    querying per row.
+
+    With ``stream_threshold`` set, list requests whose limit exceeds it (or
+    that have no limit) are streamed as a JSON array while rows are fetched
+    ``yield_per`` at a time, instead of materializing every ORM object first.
+    The rows are read after the route has returned, so this needs the ``db``
+    dependency to stay open until the response has been sent: FastAPI 0.118
+    and later do this for dependencies with ``yield``, while 0.106 to 0.117
+    close them before the body is streamed.
+    Streamed pages carry no ``Link`` header and cannot be combined with
+    joined eager loading of collections.
+
+    On databases that support ``UPDATE``/``DELETE ... RETURNING``, models
+    without relationships are updated and deleted with a single bulk
+    statement instead of loading the ORM object first. Such statements do not
+    fire ``before_update``/``after_update`` or ``before_delete``/
+    ``after_delete`` mapper events; models with ``@validates`` hooks always
+    take the ORM path for updates.
+
+    ``db`` may also be a ``scoped_session``. Its thread-local registry is not
+    used, because FastAPI does not keep a request on one thread between the
+    dependency and the route; instead each request gets its own session from
+    the registry's ``session_factory``, which is committed and closed when
+    the response has been sent. Whichever form ``db`` takes, every request
+    holds a pooled connection while it runs, so size the engine's pool for
+    the expected concurrency and let it recycle stale connections, e.g.
+    ``create_engine(url, pool_size=20, max_overflow=10, pool_pre_ping=True,
+    pool_recycle=3600)``.
+    """
+
+    _excluded_params = frozenset(("skip", "limit", "cursor"))
+
     def __init__(
         self,
         schema: Type[SCHEMA],
@@ -47,16 +138,77 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
         update_route: Union[bool, DEPENDENCIES] = True,
         delete_one_route: Union[bool, DEPENDENCIES] = True,
         delete_all_route: Union[bool, DEPENDENCIES] = True,
+        eager_load: Optional[List[str]] = None,
+        strict_loading: bool = False,
+        stream_threshold: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         assert (
             sqlalchemy_installed
         ), "SQLAlchemy must be installed to use the SQLAlchemyCRUDRouter."
 
+        if isinstance(db, scoped_session):
+            db = _session_dependency(db.session_factory)
+
         self.db_model = db_model
         self.db_func = db
-        self._pk: str = db_model.__table__.primary_key.columns.keys()[0]
+        self._stream_threshold = stream_threshold
+        self._table = db_model.__table__
+        self._columns = tuple(self._table.columns)
+
+        pk_cols = tuple(self._table.primary_key.columns)
+        assert (
+            len(pk_cols) == 1
+        ), "SQLAlchemyCRUDRouter requires a model with a single column primary key."
+        self._pk_col = pk_cols[0]
+        self._pk: str = self._pk_col.key
+        # Attribute holding the primary key on model instances, which may be
+        # named differently from the column
+        self._pk_attr: str = db_model.__mapper__.get_property_by_column(
+            self._pk_col
+        ).key
         self._pk_type: type = _utils.get_pk_type(schema, self._pk)
+        self._filter_clauses = {
+            column.key: column == bindparam(column.key)
+            for column in self._columns
+        }
+        # Mapped attribute names can differ from column names, so RETURNING
+        # rows are turned into responses through this mapping
+        self._attr_columns = {
+            attr.key: attr.columns[0]
+            for attr in db_model.__mapper__.column_attrs
+            if self._table.c.contains_column(attr.columns[0])
+        }
+
+        self._loader_opts = [
+            selectinload(getattr(db_model, relationship))
+            for relationship in eager_load or []
+        ]
+        if strict_loading:
+            self._loader_opts.append(raiseload("*"))
+
+        # Statements are built once and re-executed with bound parameters
+        self._stmt_get = (
+            select(db_model)
+            .where(self._pk_col == bindparam("id"))
+            .options(*self._loader_opts)
+        )
+        self._stmt_list = lru_cache(maxsize=256)(self._build_list_stmt)
+        self._stmt_delete = (
+            delete(db_model)
+            .where(self._pk_col == bindparam("id"))
+            .returning(*self._attr_columns.values())
+        )
+
+        # Resolve the python type used to parse each filterable column up front
+        self._filter_coercers: Dict[str, Callable[[Any], Any]] = {}
+        for column in self._columns:
+            if column.key in self._excluded_params:
+                continue
+            try:
+                self._filter_coercers[column.key] = column.type.python_type
+            except NotImplementedError:
+                self._filter_coercers[column.key] = str
 
         super().__init__(
             schema=schema,
@@ -74,40 +226,63 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
             **kwargs,
         )
 
+        # Responses can be built from RETURNING alone when the model has no
+        # relationships to serialize and every response field is a mapped
+        # column; updates also need every updated field to be one, and no
+        # @validates hooks, which the bulk UPDATE would skip
+        self._delete_returning = (
+            not db_model.__mapper__.relationships
+            and self.schema.model_fields.keys() <= self._attr_columns.keys()
+        )
+        update_fields = set(self.update_schema.model_fields) - {self._pk}
+        self._update_returning = (
+            self._delete_returning
+            and not db_model.__mapper__.validators
+            and bool(update_fields)
+            and update_fields <= self._attr_columns.keys()
+        )
+
     def _parse_query_params(self, query_params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse query parameters into filters for the database query.
-        Exclude pagination-related parameters like 'skip' and 'limit'.
+        Exclude pagination-related parameters like 'skip', 'limit' and 'cursor'.
         """
         filters = {}
-        accepted_fields = self.db_model.__table__.columns
-    
-        # Exclude pagination-related parameters
-        excluded_params = {"skip", "limit"}
-    
         for key, value in query_params.items():
-            if key in excluded_params:
+            if key in self._excluded_params:
                 continue  # Skip pagination parameters
-            if key in accepted_fields:
-                column = getattr(self.db_model, key)
-                try:
-                    column_type = column.type.python_type
-                    parsed_value = column_type(value)
-                    filters[key] = parsed_value
-                except (ValueError, TypeError) as e:
-                    raise HTTPException(
-                        status_code=422, detail=f"Invalid value for {key}: {e}"
-                    )
-            else:
+
+            coerce = self._filter_coercers.get(key)
+            if coerce is None:
                 raise HTTPException(400, f"Invalid filter field: {key}")
+
+            try:
+                filters[key] = coerce(value)
+            except (ValueError, TypeError) as e:
+                raise HTTPException(
+                    status_code=422, detail=f"Invalid value for {key}: {e}"
+                )
     
         return filters
 
 
     def _get_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
+        """
+        Items are returned in primary key order. Passing the primary key of the
+        last item seen as ``cursor`` seeks directly to the next page
+        (``WHERE pk > cursor``) instead of scanning and discarding ``skip``
+        rows, so deep pages cost the same as the first one. The trade-off is
+        that pages can only be walked forwards; ``skip`` is still honoured
+        when no cursor is given but is deprecated. When a full page is
+        returned, the URL of the next page is sent in a ``Link`` header.
+        """
+
         def route(
+            request: Request,
+            response: Response,
             db: Session = Depends(self.db_func),
             pagination: PAGINATION = self.pagination,
+            cursor: Optional[self._pk_type] = None,  # type: ignore
             query_params: Dict[str, Any] = Depends(query_params),
         ) -> List[Model]:
             skip = pagination.get("skip", 0)
@@ -116,20 +291,35 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
             # Parse and validate query parameters
             filters = self._parse_query_params(query_params)
     
-            # Apply filters to the query
-            db_models: Model = (
-                db.query(self.db_model)
-                .filter_by(**filters)
-                .order_by(getattr(self.db_model, self._pk))
-                .limit(limit)
-                .offset(skip)
-                .all()
-            )
-    
-            if db_models:
-                return db_models
+            # Apply filters to the query as bound parameters
+            params = dict(filters)
+            if cursor is not None:
+                params["cursor"] = cursor
             else:
-                raise NOT_FOUND from None
+                params["skip"] = skip
+            if limit is not None:
+                params["limit"] = limit
+
+            stmt = self._stmt_list(
+                tuple(sorted(filters)), cursor is not None, limit is not None
+            )
+
+            if self._stream_threshold is not None and (
+                limit is None or limit > self._stream_threshold
+            ):
+                return StreamingResponse(  # type: ignore
+                    self._stream_json(db, stmt, params), media_type="application/json"
+                )
+
+            db_models: List[Model] = db.execute(stmt, params).scalars().unique().all()
+
+            if limit is not None and len(db_models) == limit:
+                next_url = request.url.remove_query_params("skip").include_query_params(
+                    cursor=getattr(db_models[-1], self._pk_attr)
+                )
+                response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+            return db_models
     
         return route
 
@@ -138,12 +328,7 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
         def route(
             item_id: self._pk_type, db: Session = Depends(self.db_func)  # type: ignore
         ) -> Model:
-            model: Model = db.query(self.db_model).get(item_id)
-
-            if model:
-                return model
-            else:
-                raise NOT_FOUND from None
+            return self._fetch_or_404(db, item_id)
 
         return route
 
@@ -153,14 +338,14 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
             db: Session = Depends(self.db_func),
         ) -> Model:
             try:
-                db_model: Model = self.db_model(**model.dict())
+                db_model: Model = self.db_model(**model.model_dump())
                 db.add(db_model)
                 db.commit()
                 db.refresh(db_model)
                 return db_model
-            except IntegrityError:
+            except IntegrityError as e:
                 db.rollback()
-                raise HTTPException(422, "Key already exists") from None
+                self._raise_integrity_error(e)
 
         return route
 
@@ -169,11 +354,32 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
             item_id: self._pk_type,  # type: ignore
             model: self.update_schema,  # type: ignore
             db: Session = Depends(self.db_func),
-        ) -> Model:
+        ) -> Any:
+            values = model.model_dump(exclude={self._pk})
+
             try:
-                db_model: Model = self._get_one()(item_id, db)
+                if self._update_returning and self._supports_returning(
+                    db, "update_returning"
+                ):
+                    # One UPDATE ... RETURNING instead of SELECT, UPDATE, SELECT
+                    stmt = (
+                        update(self.db_model)
+                        .where(self._pk_col == item_id)
+                        .values(
+                            {self._attr_columns[k]: v for k, v in values.items()}
+                        )
+                        .returning(*self._attr_columns.values())
+                    )
+                    row = db.execute(stmt).first()
+                    if row is None:
+                        raise NOT_FOUND from None
 
-                for key, value in model.dict(exclude={self._pk}).items():
+                    db.commit()
+                    return self._row_to_dict(row)
+
+                db_model: Model = self._fetch_or_404(db, item_id)
+
+                for key, value in values.items():
                     if hasattr(db_model, key):
                         setattr(db_model, key, value)
 
@@ -183,27 +389,111 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
                 return db_model
             except IntegrityError as e:
                 db.rollback()
-                self._raise(e)
+                self._raise_integrity_error(e)
 
         return route
 
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         def route(db: Session = Depends(self.db_func)) -> List[Model]:
-            db.query(self.db_model).delete()
+            db.execute(delete(self.db_model))
             db.commit()
 
-            return self._get_all()(db=db, pagination={"skip": 0, "limit": None})
+            return []
 
         return route
 
     def _delete_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
         def route(
             item_id: self._pk_type, db: Session = Depends(self.db_func)  # type: ignore
-        ) -> Model:
-            db_model: Model = self._get_one()(item_id, db)
+        ) -> Any:
+            if self._delete_returning and self._supports_returning(
+                db, "delete_returning"
+            ):
+                # One DELETE ... RETURNING instead of SELECT then DELETE
+                row = db.execute(self._stmt_delete, {"id": item_id}).first()
+                if row is None:
+                    raise NOT_FOUND from None
+
+                db.commit()
+                return self._row_to_dict(row)
+
+            db_model: Model = self._fetch_or_404(db, item_id)
             db.delete(db_model)
             db.commit()
 
             return db_model
 
         return route
+
+    def _raise_integrity_error(self, e: IntegrityError) -> None:
+        orig = e.orig
+        code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+        if code == _UNIQUE_SQLSTATE or (
+            code is None and _UNIQUE_RE.search(str(orig))
+        ):
+            raise HTTPException(422, "Key already exists") from None
+
+        self._raise(e)
+
+    def _row_to_dict(self, row: Any) -> Dict[str, Any]:
+        mapping = row._mapping
+        return {key: mapping[column] for key, column in self._attr_columns.items()}
+
+    @staticmethod
+    def _supports_returning(db: Session, feature: str) -> bool:
+        """
+        UPDATE/DELETE ... RETURNING is available on e.g. Postgres and
+        SQLite >= 3.35. MySQL and friends fall back to loading the ORM object.
+        """
+        dialect = db.get_bind().dialect
+        supported = getattr(dialect, feature, None)
+        if supported is None:
+            # SQLAlchemy 1.4 only exposes the combined full_returning flag,
+            # which 2.0 deprecates, so only read it when feature is missing
+            supported = getattr(dialect, "full_returning", False)
+        return bool(supported)
+
+    def _build_list_stmt(
+        self, filter_keys: Tuple[str, ...], seek: bool, paginated: bool
+    ) -> "Select":
+        stmt = (
+            select(self.db_model)
+            .where(*(self._filter_clauses[key] for key in filter_keys))
+            .order_by(self._pk_col)
+            .options(*self._loader_opts)
+        )
+
+        if seek:
+            stmt = stmt.where(self._pk_col > bindparam("cursor"))
+        else:
+            stmt = stmt.offset(bindparam("skip", type_=Integer))
+
+        if paginated:
+            stmt = stmt.limit(bindparam("limit", type_=Integer))
+
+        return stmt
+
+    def _stream_json(
+        self, db: Session, stmt: "Select", params: Dict[str, Any]
+    ) -> Iterator[bytes]:
+        result = db.execute(stmt.execution_options(yield_per=500), params).scalars()
+
+        try:
+            yield b"["
+            for index, db_model in enumerate(result):
+                if index:
+                    yield b","
+                item = self.schema.model_validate(db_model, from_attributes=True)
+                yield item.model_dump_json(by_alias=True).encode()
+            yield b"]"
+        finally:
+            result.close()
+
+    def _fetch_or_404(self, db: Session, item_id: Any) -> Model:
+        result = db.execute(self._stmt_get, {"id": item_id})
+        db_model: Optional[Model] = result.unique().scalar_one_or_none()
+
+        if db_model is None:
+            raise NOT_FOUND from None
+
+        return db_model
@@ -0,0 +1,45 @@
+from fastapi.testclient import TestClient
+
+from tests import PAGINATION_SIZE
+from tests.implementations.sqlalchemy_ import sqlalchemy_implementation, DSN_LIST
+
+POTATO_URL = "/potato"
+INSERT_COUNT = 25
+basic_potato = dict(thickness=0.24, mass=1.2, color="Brown", type="Russet")
+
+
+def create_client():
+    app, router, settings = sqlalchemy_implementation(db_uri=DSN_LIST[0])
+    [app.include_router(router(**kwargs)) for kwargs in settings]
+    return TestClient(app)
+
+
+def test_cursor_paging():
+    client = create_client()
+    for _ in range(INSERT_COUNT):
+        assert client.post(POTATO_URL, json=basic_potato).status_code == 200
+
+    ids = []
+    res = client.get(POTATO_URL, params={"limit": PAGINATION_SIZE})
+    while True:
+        assert res.status_code == 200, res.json()
+        ids.extend(item["id"] for item in res.json())
+
+        if "next" not in res.links:
+            break
+
+        res = client.get(res.links["next"]["url"])
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == INSERT_COUNT
+
+
+def test_cursor_skips_seen_items():
+    client = create_client()
+    for _ in range(3):
+        assert client.post(POTATO_URL, json=basic_potato).status_code == 200
+
+    first, *rest = client.get(POTATO_URL).json()
+    res = client.get(POTATO_URL, params={"cursor": first["id"]})
+    assert res.status_code == 200, res.json()
+    assert res.json() == rest
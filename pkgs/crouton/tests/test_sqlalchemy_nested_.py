@@ -25,7 +25,7 @@ class ParentCreate(BaseModel):
     pass
 
 
-def create_app():
+def create_app(**parent_kwargs):
     app, engine, Base, session = _setup_base_app()
 
     class Child(Base):
@@ -46,6 +46,7 @@ def create_app():
         db_model=Parent,
         db=session,
         prefix=PARENT_URL,
+        **parent_kwargs,
     )
     child_router = SQLAlchemyCRUDRouter(
         schema=ChildSchema, db_model=Child, db=session, prefix=CHILD_URL
@@ -67,3 +68,16 @@ def test_nested_models():
 
     data = res.json()
     assert type(data["children"]) is list and data["children"], data
+
+
+def test_eager_loaded_nested_models():
+    client = TestClient(create_app(eager_load=["children"], strict_loading=True))
+
+    parent = test_router.test_post(client, PARENT_URL, dict())
+    test_router.test_post(client, CHILD_URL, dict(id=0, parent_id=parent["id"]))
+
+    res = client.get(PARENT_URL)
+    assert res.status_code == 200, res.json()
+
+    data = res.json()
+    assert len(data) == 1 and data[0]["children"], data
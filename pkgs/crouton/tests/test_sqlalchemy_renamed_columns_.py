@@ -0,0 +1,122 @@
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import validates
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from tests.implementations.sqlalchemy_ import _setup_base_app
+
+PEPPER_URL = "/peppers"
+
+
+class PepperCreate(BaseModel):
+    kind: str
+
+
+class Pepper(PepperCreate):
+    ident: int
+
+    class Config:
+        orm_mode = True
+
+
+def create_client():
+    app, engine, Base, session = _setup_base_app()
+
+    class PepperModel(Base):
+        __tablename__ = "peppers"
+        ident = Column("id", Integer, primary_key=True, index=True)
+        kind = Column("type", String)
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SQLAlchemyCRUDRouter(
+            schema=Pepper,
+            create_schema=PepperCreate,
+            update_schema=PepperCreate,
+            db_model=PepperModel,
+            db=session,
+            prefix="peppers",
+        )
+    )
+
+    return TestClient(app)
+
+
+def create_validated_client():
+    app, engine, Base, session = _setup_base_app()
+
+    class PepperModel(Base):
+        __tablename__ = "peppers"
+        ident = Column("id", Integer, primary_key=True, index=True)
+        kind = Column("type", String)
+
+        @validates("kind")
+        def validate_kind(self, key, value):
+            return value.lower()
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SQLAlchemyCRUDRouter(
+            schema=Pepper,
+            create_schema=PepperCreate,
+            update_schema=PepperCreate,
+            db_model=PepperModel,
+            db=session,
+            prefix="peppers",
+        )
+    )
+
+    return TestClient(app)
+
+
+def test_update_renamed_columns():
+    client = create_client()
+    res = client.post(PEPPER_URL, json=dict(kind="jalapeno"))
+    assert res.status_code == 200, res.json()
+    pepper = res.json()
+
+    res = client.put(f"{PEPPER_URL}/{pepper['ident']}", json=dict(kind="habanero"))
+    assert res.status_code == 200, res.json()
+    assert res.json() == dict(pepper, kind="habanero")
+
+
+def test_delete_renamed_columns():
+    client = create_client()
+    res = client.post(PEPPER_URL, json=dict(kind="jalapeno"))
+    assert res.status_code == 200, res.json()
+    pepper = res.json()
+
+    res = client.delete(f"{PEPPER_URL}/{pepper['ident']}")
+    assert res.status_code == 200, res.json()
+    assert res.json() == pepper
+    assert client.get(PEPPER_URL).json() == []
+
+
+def test_update_runs_validators():
+    client = create_validated_client()
+    res = client.post(PEPPER_URL, json=dict(kind="Jalapeno"))
+    assert res.status_code == 200, res.json()
+    pepper = res.json()
+    assert pepper["kind"] == "jalapeno"
+
+    res = client.put(f"{PEPPER_URL}/{pepper['ident']}", json=dict(kind="Habanero"))
+    assert res.status_code == 200, res.json()
+    assert res.json() == dict(pepper, kind="habanero")
+    assert client.get(f"{PEPPER_URL}/{pepper['ident']}").json()["kind"] == "habanero"
+
+
+def test_limit_renamed_columns():
+    client = create_client()
+    kinds = ["jalapeno", "habanero", "poblano"]
+    for kind in kinds:
+        assert client.post(PEPPER_URL, json=dict(kind=kind)).status_code == 200
+
+    res = client.get(PEPPER_URL, params=dict(limit=2))
+    assert res.status_code == 200, res.json()
+    assert [pepper["kind"] for pepper in res.json()] == kinds[:2]
+
+    next_url = res.links["next"]["url"]
+    res = client.get(next_url)
+    assert res.status_code == 200, res.json()
+    assert [pepper["kind"] for pepper in res.json()] == kinds[2:]
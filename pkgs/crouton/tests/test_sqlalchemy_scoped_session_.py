@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from tests import Potato
+from tests.implementations.sqlalchemy_ import _setup_base_app
+
+POTATO_URL = "/potato"
+basic_potato = dict(thickness=0.24, mass=1.2, color="Brown", type="Russet")
+
+
+def create_client():
+    app, engine, Base, _ = _setup_base_app()
+
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        thickness = Column(Float)
+        mass = Column(Float)
+        color = Column(String)
+        type = Column(String)
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SQLAlchemyCRUDRouter(
+            schema=Potato,
+            db_model=PotatoModel,
+            db=scoped_session(sessionmaker(bind=engine)),
+            prefix="potato",
+        )
+    )
+
+    return TestClient(app)
+
+
+def test_scoped_session():
+    client = create_client()
+
+    res = client.post(POTATO_URL, json=basic_potato)
+    assert res.status_code == 200, res.json()
+    potato = res.json()
+
+    res = client.get(f"{POTATO_URL}/{potato['id']}")
+    assert res.status_code == 200, res.json()
+    assert res.json() == potato
+
+    res = client.delete(f"{POTATO_URL}/{potato['id']}")
+    assert res.status_code == 200, res.json()
+    assert client.get(POTATO_URL).json() == []
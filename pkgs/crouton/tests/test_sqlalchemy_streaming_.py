@@ -0,0 +1,106 @@
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import Column, Integer, String
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from tests import PAGINATION_SIZE
+from tests.implementations.sqlalchemy_ import (
+    _setup_base_app,
+    sqlalchemy_implementation,
+    DSN_LIST,
+)
+
+POTATO_URL = "/potato"
+STREAMED_URL = "/streamed_potato"
+basic_potato = dict(thickness=0.24, mass=1.2, color="Brown", type="Russet")
+
+
+def create_client():
+    app, router, settings = sqlalchemy_implementation(db_uri=DSN_LIST[0])
+    [app.include_router(router(**kwargs)) for kwargs in settings]
+
+    # Same model again, streaming every list response
+    potato_settings = dict(settings[0], prefix="streamed_potato", stream_threshold=0)
+    app.include_router(router(**potato_settings))
+
+    return TestClient(app)
+
+
+class PepperCreate(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    kind: str = Field(alias="pepperKind")
+
+
+class Pepper(PepperCreate):
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    id: int
+
+
+def create_aliased_client():
+    app, engine, Base, session = _setup_base_app()
+
+    class PepperModel(Base):
+        __tablename__ = "peppers"
+        id = Column(Integer, primary_key=True, index=True)
+        kind = Column(String)
+
+    Base.metadata.create_all(bind=engine)
+    for prefix, stream_threshold in (("peppers", None), ("streamed_peppers", 0)):
+        app.include_router(
+            SQLAlchemyCRUDRouter(
+                schema=Pepper,
+                create_schema=PepperCreate,
+                db_model=PepperModel,
+                db=session,
+                prefix=prefix,
+                stream_threshold=stream_threshold,
+            )
+        )
+
+    return TestClient(app)
+
+
+def assert_streamed_matches(client, url=POTATO_URL, streamed_url=STREAMED_URL, **params):
+    expected = client.get(url, params=params)
+    res = client.get(streamed_url, params=params)
+    assert res.status_code == 200, res.text
+    assert res.headers["content-type"] == "application/json"
+    assert res.json() == expected.json()
+    assert "link" not in res.headers
+
+
+def test_stream_empty():
+    client = create_client()
+    res = client.get(STREAMED_URL)
+    assert res.status_code == 200, res.text
+    assert res.content == b"[]"
+
+
+def test_stream_one_row():
+    client = create_client()
+    assert client.post(POTATO_URL, json=basic_potato).status_code == 200
+
+    assert_streamed_matches(client)
+    assert len(client.get(STREAMED_URL).json()) == 1
+
+
+def test_stream_matches_list():
+    client = create_client()
+    for _ in range(PAGINATION_SIZE * 2):
+        assert client.post(POTATO_URL, json=basic_potato).status_code == 200
+
+    assert_streamed_matches(client, limit=PAGINATION_SIZE)
+    assert_streamed_matches(client, limit=PAGINATION_SIZE, skip=1)
+    assert_streamed_matches(client, limit=PAGINATION_SIZE, cursor=2)
+    assert_streamed_matches(client, color=basic_potato["color"], limit=PAGINATION_SIZE)
+
+
+def test_stream_aliased_schema():
+    client = create_aliased_client()
+    res = client.post("/peppers", json={"pepperKind": "jalapeno"})
+    assert res.status_code == 200, res.text
+
+    assert_streamed_matches(client, "/peppers", "/streamed_peppers")
+    assert client.get("/streamed_peppers").json() == [dict(id=1, pepperKind="jalapeno")]
@@ -14,6 +14,4 @@ class UUIDGenerator(BaseModel):
         name = str(uuid4())  # Generate a random UUID for the name
         return str(uuid5(self.namespace, name))
 
-# Example usage
-generator = UUIDGenerator()
-print(generator.create())
+# Example usage: UUIDGenerator().create()
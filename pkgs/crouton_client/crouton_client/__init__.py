@@ -1,2 +1,7 @@
+import logging
 
-from .blocking import CroutonClient
+from .client import CroutonClient, CroutonHTTPError
+
+# Leave logging configuration to the application: the package logger only gets
+# a NullHandler, and modules log through children of it
+logging.getLogger(__name__).addHandler(logging.NullHandler())
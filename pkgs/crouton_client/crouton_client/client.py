@@ -0,0 +1,431 @@
+import asyncio
+import httpx
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+from typing import Optional, Any, AsyncIterator, Dict, Iterator, List, Sequence
+from .UUID import UUIDGenerator
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return _json_dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson_installed = False
+else:
+    ijson_installed = True
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+logger = logging.getLogger(__name__)
+
+# The generator is stateless, so one instance serves every request
+_UUIDGEN = UUIDGenerator()
+
+
+class CroutonHTTPError(ValueError):
+    """
+    Raised when the API answers with an error status. The response body is only
+    decoded when the message is actually read.
+    """
+
+    def __init__(self, method: str, response: httpx.Response):
+        super().__init__(method, response.status_code)
+        self.method = method
+        self.status_code = response.status_code
+        self.response = response
+
+    def __str__(self) -> str:
+        return f"{self.method} request failed with status {self.status_code}: {self.response.text}"
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _build_path_cached(api_root: str, resource: str, item_id: Any) -> str:
+    """
+    Construct the path part of a request URL. Polling the same endpoint builds
+    the same path over and over, so results are cached; typed=True keeps equal
+    ids of different types (1 and True) apart, since they are quoted differently.
+    """
+    url = f"{api_root}/{resource.strip('/')}"
+
+    # Add item ID if provided
+    if item_id:
+        url += f"/{quote(str(item_id), safe='')}"
+
+    return url
+
+
+def _array_start(method: str, chunk: bytes) -> bytes:
+    """
+    Strip leading whitespace from the first non-empty chunk of a streamed body
+    and make sure it opens a JSON array; anything else would silently yield
+    nothing from the item parser.
+    """
+    chunk = chunk.lstrip()
+    if chunk and chunk[:1] != b"[":
+        raise ValueError(f"Streaming {method} request expected a JSON array, got {chunk[:64]!r}")
+    return chunk
+
+
+class CroutonClient:
+    """
+    Client for a crouton API. Connections are pooled and kept alive, so create
+    one client per process and reuse it, closing it on shutdown with close() /
+    aclose() or by using it as a (sync or async) context manager.
+
+    Like the requests-based client it replaced, requests wait indefinitely by
+    default; pass timeout (seconds) to bound connecting, reading and writing.
+    """
+
+    def __init__(
+        self,
+        API_ROOT: str,
+        ACCESS_STRING: Optional[str] = None,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        retries: int = 3,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.API_ROOT = API_ROOT.rstrip('/')  # Ensure no trailing slash
+        self.ACCESS_STRING = ACCESS_STRING
+        # The access token query parameter never changes, so encode it once
+        self._token_suffix = urlencode({"token": ACCESS_STRING.strip('?')}) if ACCESS_STRING else ""
+        # Reuse one client so connections are kept alive between requests; HTTP/2
+        # multiplexes concurrent requests over a single connection when the
+        # server supports it. Idle connections are kept for keepalive_expiry
+        # seconds, which should not exceed the server's keep-alive timeout.
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Failed connection attempts are retried by the transport, reusing the
+        # warm pool; requests that reached the server are never resent
+        self._retries = retries
+        # No timeout by default, so slow responses such as large lists are
+        # waited for; pass timeout (in seconds) to bound each network operation
+        self._timeout = httpx.Timeout(timeout)
+        # Transports are explicit so pooling and HTTP/2 live in one place; a
+        # custom transport (e.g. httpx.MockTransport) replaces them entirely.
+        # Redirects are not followed and, apart from gzip/deflate, encodings
+        # are only advertised when their decoders (e.g. brotli) are installed.
+        self._async_transport = async_transport
+        self._sync_client = httpx.Client(
+            transport=transport
+            or httpx.HTTPTransport(http2=True, limits=self._limits, retries=self._retries),
+            timeout=self._timeout,
+            follow_redirects=False,
+        )
+        # Async connections belong to the event loop that opened them, so one
+        # async client is kept per loop
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Lazily create the async client of the running event loop so connections,
+        DNS lookups and TLS handshakes are reused across asynchronous requests,
+        while calls made from another loop (e.g. a later asyncio.run) get a
+        client of their own.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            # Pooled connections keep their loop alive, so forget the clients of
+            # loops that have been closed instead of waiting for them to be freed
+            for closed_loop in [other for other in self._async_clients if other.is_closed()]:
+                del self._async_clients[closed_loop]
+
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                transport=self._async_transport
+                or httpx.AsyncHTTPTransport(
+                    http2=True, limits=self._limits, retries=self._retries
+                ),
+                timeout=self._timeout,
+                follow_redirects=False,
+            )
+        return client
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and its pooled connections.
+        """
+        self._sync_client.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the running event loop's async client and its pooled connections.
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "CroutonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "CroutonClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+        self.close()
+
+    def _build_url(self, resource: str, item_id: Optional[str] = None, query_params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Helper method to construct the URL with resource, item_id, and query parameters.
+        """
+        try:
+            url = _build_path_cached(self.API_ROOT, resource, item_id)
+        except TypeError:
+            # Unhashable item ids cannot be cached
+            url = _build_path_cached.__wrapped__(self.API_ROOT, resource, item_id)
+
+        # Filters are encoded on every call: equal values of different types
+        # (1, 1.0, True) encode differently, so they cannot share a cache entry.
+        # Lists are sent as repeated keys. The access string is pre-encoded.
+        if query_params:
+            url += f"?{urlencode(query_params, doseq=True)}"
+            if self._token_suffix:
+                url += f"&{self._token_suffix}"
+        elif self._token_suffix:
+            url += f"?{self._token_suffix}"
+
+        return url
+
+    def _check(self, method: str, res: httpx.Response) -> Any:
+        """
+        Return the decoded JSON body of a successful response (None when it is
+        empty) or raise a CroutonHTTPError.
+        """
+        # Redirects are not followed, so anything outside 2xx is an error;
+        # 204 No Content and other empty bodies decode to None
+        if res.status_code < 300:
+            return json_loads(res.content) if res.content else None
+
+        logger.error("%s request failed with status %s: %r", method, res.status_code, res.content[:512])
+        raise CroutonHTTPError(method, res)
+
+    def _handle(self, method: str, url: str, data_obj: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send a request with the blocking client and return its checked result.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            if data_obj is None:
+                logger.debug("Performing %s request to %s", method, url)
+            else:
+                logger.debug("Performing %s request to %s with data %s", method, url, data_obj)
+        if data_obj is None:
+            res = self._sync_client.request(method, url)
+        else:
+            res = self._sync_client.request(method, url, content=json_dumps(data_obj), headers=_JSON_HEADERS)
+        return self._check(method, res)
+
+    async def _ahandle(self, method: str, url: str, data_obj: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Asynchronous counterpart of _handle using the shared async client.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            if data_obj is None:
+                logger.debug("Performing asynchronous %s request to %s", method, url)
+            else:
+                logger.debug("Performing asynchronous %s request to %s with data %s", method, url, data_obj)
+        if data_obj is None:
+            res = await self._get_async_client().request(method, url)
+        else:
+            res = await self._get_async_client().request(
+                method, url, content=json_dumps(data_obj), headers=_JSON_HEADERS
+            )
+        return self._check(method, res)
+
+    def get(
+        self, 
+        resource: str, 
+        item_id: Optional[str] = None, 
+        filters: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """
+        Perform a GET request with optional filters and an item ID.
+        """
+        url = self._build_url(resource, item_id, filters)
+        return self._handle("GET", url)
+
+    def post(self, resource: str, data_obj: dict) -> dict:
+        """
+        Perform a POST request to create a resource.
+        """
+        # Add a generated id to a copy so the caller's dict is left untouched
+        payload = data_obj if 'id' in data_obj else {**data_obj, 'id': _UUIDGEN.create()}
+        url = self._build_url(resource)
+        return self._handle("POST", url, payload)
+
+    def put(self, resource: str, data_obj: dict, item_id: str) -> dict:
+        """
+        Perform a PUT request to update a resource.
+        """
+        url = self._build_url(resource, item_id)
+        return self._handle("PUT", url, data_obj)
+
+    def delete(self, resource: str, item_id: Optional[str] = None) -> dict:
+        """
+        Perform a DELETE request to delete a resource.
+        """
+        url = self._build_url(resource, item_id)
+        return self._handle("DELETE", url)
+
+    def iter_get(self, resource: str, filters: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        Perform a GET request for a list of items and yield each item as soon as
+        it has been received, instead of buffering and decoding the whole
+        response first. Requires ijson.
+        """
+        assert ijson_installed, "ijson must be installed to use iter_get."
+        url = self._build_url(resource, None, filters)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Streaming GET request to %s", url)
+        with self._sync_client.stream("GET", url) as res:
+            if res.status_code >= 300:
+                res.read()
+                self._check("GET", res)
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            started = False
+            for chunk in res.iter_bytes():
+                if not started:
+                    chunk = _array_start("GET", chunk)
+                    if not chunk:
+                        continue
+                    started = True
+                parser.send(chunk)
+                yield from items
+                del items[:]
+            # An empty 2xx body (such as a 204) has no items, as in get()
+            if started:
+                parser.close()
+                yield from items
+
+    def get_many(self, specs: Sequence[Sequence[Any]], max_workers: int = 16) -> List[Any]:
+        """
+        Perform several GET requests in parallel threads. Each spec holds the
+        arguments of one get call, (resource, item_id, filters), and results are
+        returned in the order of the specs. The threads share the client's
+        connection pool, so keep max_workers at or below max_keepalive_connections.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda spec: self.get(*spec), specs))
+
+    def post_many(self, specs: Sequence[Sequence[Any]], max_workers: int = 16) -> List[Any]:
+        """
+        Perform several POST requests in parallel threads, one per
+        (resource, data_obj) spec, returning the results in order.
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda spec: self.post(*spec), specs))
+
+    async def aget(
+        self, 
+        resource: str, 
+        item_id: Optional[str] = None, 
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform an asynchronous GET request with optional filters and an item ID.
+        """
+        url = self._build_url(resource, item_id, filters)
+        return await self._ahandle("GET", url)
+
+    async def apost(self, resource: str, data_obj: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform an asynchronous POST request to create a resource.
+        """
+        # Add a generated id to a copy so the caller's dict is left untouched
+        payload = data_obj if 'id' in data_obj else {**data_obj, 'id': _UUIDGEN.create()}
+        url = self._build_url(resource)
+        return await self._ahandle("POST", url, payload)
+
+    async def aput(self, resource: str, data_obj: Dict[str, Any], item_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Perform an asynchronous PUT request to update a resource.
+        """
+        url = self._build_url(resource, item_id)
+        return await self._ahandle("PUT", url, data_obj)
+
+    async def adelete(self, resource: str, item_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Perform an asynchronous DELETE request to delete a resource.
+        """
+        url = self._build_url(resource, item_id)
+        return await self._ahandle("DELETE", url)
+
+    async def aiter_get(self, resource: str, filters: Optional[Dict[str, Any]] = None) -> AsyncIterator[Any]:
+        """
+        Asynchronous counterpart of iter_get, yielding list items as they arrive.
+        Requires ijson.
+        """
+        assert ijson_installed, "ijson must be installed to use aiter_get."
+        url = self._build_url(resource, None, filters)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Streaming asynchronous GET request to %s", url)
+        async with self._get_async_client().stream("GET", url) as res:
+            if res.status_code >= 300:
+                await res.aread()
+                self._check("GET", res)
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+            started = False
+            async for chunk in res.aiter_bytes():
+                if not started:
+                    chunk = _array_start("GET", chunk)
+                    if not chunk:
+                        continue
+                    started = True
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            # An empty 2xx body (such as a 204) has no items, as in aget()
+            if started:
+                parser.close()
+                for item in items:
+                    yield item
+
+    async def aget_many(self, specs: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        Perform several asynchronous GET requests concurrently. Each spec holds the
+        arguments of one aget call, (resource, item_id, filters), and results are
+        returned in the order of the specs. Over HTTP/2 all of the requests are
+        multiplexed on one connection.
+        """
+        return await asyncio.gather(*(self.aget(*spec) for spec in specs))
+
+    async def apost_many(self, specs: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        Perform several asynchronous POST requests concurrently, one per
+        (resource, data_obj) spec, returning the results in order.
+        """
+        return await asyncio.gather(*(self.apost(*spec) for spec in specs))
+
+    async def aput_many(self, specs: Sequence[Sequence[Any]]) -> List[Any]:
+        """
+        Perform several asynchronous PUT requests concurrently, one per
+        (resource, data_obj, item_id) spec, returning the results in order.
+        """
+        return await asyncio.gather(*(self.aput(*spec) for spec in specs))
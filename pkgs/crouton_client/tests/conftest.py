@@ -1,67 +1,54 @@
-import pytest
-from fastapi.testclient import TestClient
-
-from .implementations import *
-
+import json
 
-def yield_test_client(app, impl):
-    if impl.__name__ == "tortoise_implementation":
-        from tortoise.contrib.test import initializer, finalizer
-
-        initializer(["tests.implementations.tortoise_"])
-        with TestClient(app) as c:
-            yield c
-        finalizer()
+import httpx
+import pytest
 
-    else:
-        with TestClient(app) as c:
-            yield c
+from crouton_client import CroutonClient
 
+API_ROOT = "http://testserver"
 
-def label_func(*args):
-    func, dsn = args[0]
-    dsn = dsn.split(":")[0].split("+")[0]
-    return f"{func.__name__}-{dsn}"
 
+class FakeAPI:
+    """
+    Minimal in-memory crouton API served through httpx.MockTransport. Every
+    request is recorded so tests can check the URLs and bodies that were sent.
+    """
 
-@pytest.fixture(params=implementations, ids=label_func, scope="class")
-def client(request):
-    impl, dsn = request.param
+    def __init__(self):
+        self.items = {}
+        self.requests = []
 
-    app, router, settings = impl(db_uri=dsn)
-    [app.include_router(router(**kwargs)) for kwargs in settings]
-    yield from yield_test_client(app, impl)
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        resource, _, item_id = request.url.path.strip("/").partition("/")
 
+        if resource == "fail":
+            return httpx.Response(500, json={"detail": "boom"})
 
-@pytest.fixture(
-    params=[
-        sqlalchemy_implementation_custom_ids,
-        databases_implementation_custom_ids,
-        ormar_implementation_custom_ids,
-    ]
-)
-def custom_id_client(request):
-    yield from yield_test_client(request.param(), request.param)
+        if request.method == "GET" and not item_id:
+            return httpx.Response(200, json=list(self.items.values()))
+        if request.method == "POST":
+            item = json.loads(request.content)
+            self.items[item["id"]] = item
+            return httpx.Response(200, json=item)
+        if item_id not in self.items:
+            return httpx.Response(404, json={"detail": "Item not found"})
+        if request.method == "PUT":
+            self.items[item_id] = json.loads(request.content)
+        if request.method == "DELETE":
+            return httpx.Response(200, json=self.items.pop(item_id))
+        return httpx.Response(200, json=self.items[item_id])
 
 
-@pytest.fixture(
-    params=[
-        sqlalchemy_implementation_string_pk,
-        databases_implementation_string_pk,
-        ormar_implementation_string_pk,
-    ],
-    scope="function",
-)
-def string_pk_client(request):
-    yield from yield_test_client(request.param(), request.param)
+@pytest.fixture
+def api():
+    return FakeAPI()
 
 
-@pytest.fixture(
-    params=[
-        sqlalchemy_implementation_integrity_errors,
-        ormar_implementation_integrity_errors,
-    ],
-    scope="function",
-)
-def integrity_errors_client(request):
-    yield from yield_test_client(request.param(), request.param)
+@pytest.fixture
+def client(api):
+    transport = httpx.MockTransport(api)
+    with CroutonClient(
+        API_ROOT, ACCESS_STRING="tok", transport=transport, async_transport=transport
+    ) as client:
+        yield client
@@ -0,0 +1,240 @@
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+from crouton_client import CroutonClient, CroutonHTTPError
+from tests.conftest import API_ROOT
+
+
+@pytest.mark.parametrize(
+    "filters, query",
+    [
+        ({"flag": 1}, "flag=1"),
+        ({"flag": True}, "flag=True"),
+        ({"flag": 1.0}, "flag=1.0"),
+        ({"flag": 1}, "flag=1"),
+        ({1: "x", "a": "y"}, "1=x&a=y"),
+        ({"a": True, "b": None, "l": [1, 2]}, "a=True&b=None&l=1&l=2"),
+    ],
+)
+def test_build_url_filters(client, filters, query):
+    assert client._build_url("potato", None, filters) == f"{API_ROOT}/potato?{query}&token=tok"
+
+
+def test_build_url_item_ids(client):
+    # Equal ids of different types must not share a cached URL
+    assert client._build_url("potato", 1) == f"{API_ROOT}/potato/1?token=tok"
+    assert client._build_url("potato", True) == f"{API_ROOT}/potato/True?token=tok"
+    assert client._build_url("/potato/", "a b") == f"{API_ROOT}/potato/a%20b?token=tok"
+    assert client._build_url("potato") == f"{API_ROOT}/potato?token=tok"
+
+
+def test_crud(client, api):
+    item = client.post("potato", {"id": "p1", "color": "red"})
+    assert item == {"id": "p1", "color": "red"}
+    assert client.get("potato") == [item]
+    assert client.get("potato", "p1") == item
+
+    updated = client.put("potato", {"id": "p1", "color": "green"}, "p1")
+    assert updated == {"id": "p1", "color": "green"}
+    assert client.delete("potato", "p1") == updated
+    assert client.get("potato") == []
+
+    assert [request.method for request in api.requests] == [
+        "POST", "GET", "GET", "PUT", "DELETE", "GET"
+    ]
+    assert all(request.url.params["token"] == "tok" for request in api.requests)
+
+
+def test_post_generates_id(client):
+    data = {"color": "red"}
+    item = client.post("potato", data)
+    assert item["id"]
+    assert data == {"color": "red"}
+
+
+@pytest.mark.parametrize("status_code", [200, 201, 204])
+def test_empty_success_body(client, status_code):
+    assert client._check("DELETE", httpx.Response(status_code)) is None
+
+
+def test_created_status_is_success(client):
+    res = httpx.Response(201, json={"id": "p1"})
+    assert client._check("POST", res) == {"id": "p1"}
+
+
+def test_async_crud(client):
+    async def crud():
+        item = await client.apost("potato", {"id": "a1", "color": "red"})
+        assert await client.aget("potato", "a1") == item
+        assert await client.aput("potato", {"id": "a1", "color": "blue"}, "a1") == {
+            "id": "a1", "color": "blue"
+        }
+        assert await client.aget_many([("potato", "a1"), ("potato",)]) == [
+            {"id": "a1", "color": "blue"}, [{"id": "a1", "color": "blue"}]
+        ]
+        return await client.adelete("potato", "a1")
+
+    assert asyncio.run(crud()) == {"id": "a1", "color": "blue"}
+
+
+def test_async_client_per_event_loop(client):
+    async def get():
+        return await client.aget("potato"), client._get_async_client()
+
+    first, first_client = asyncio.run(get())
+    second, second_client = asyncio.run(get())
+
+    assert first == second == []
+    # A new loop gets its own client, and the closed loop's client is dropped
+    assert second_client is not first_client
+    assert first_client not in client._async_clients.values()
+
+
+def test_async_client_reused_within_loop(client):
+    async def clients():
+        await client.aget("potato")
+        return client._get_async_client(), client._get_async_client()
+
+    first, second = asyncio.run(clients())
+    assert first is second
+
+
+def test_http_error(client):
+    with pytest.raises(CroutonHTTPError) as exc_info:
+        client.get("potato", "missing")
+
+    error = exc_info.value
+    assert isinstance(error, ValueError)
+    assert error.method == "GET"
+    assert error.status_code == 404
+    assert str(error) == f"GET request failed with status 404: {error.response.text}"
+    assert "Item not found" in str(error)
+
+
+def test_async_http_error(client):
+    with pytest.raises(CroutonHTTPError) as exc_info:
+        asyncio.run(client.aget("fail"))
+
+    assert exc_info.value.status_code == 500
+
+
+def test_http_error_log_is_truncated(client, caplog):
+    res = httpx.Response(500, content=b"x" * 2048)
+
+    with caplog.at_level(logging.ERROR, logger="crouton_client"):
+        with pytest.raises(CroutonHTTPError) as exc_info:
+            client._check("GET", res)
+
+    (record,) = caplog.records
+    assert record.args[2] == b"x" * 512
+    assert str(exc_info.value).endswith("x" * 2048)
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """
+    Response body sent in small chunks, recording how many have been read.
+    """
+
+    def __init__(self, body: bytes, size: int = 7):
+        self.chunks = [body[i:i + size] for i in range(0, len(body), size)]
+        self.sent = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self.__iter__():
+            yield chunk
+
+
+def streaming_client(status_code, body):
+    stream = ChunkedStream(body)
+    transport = httpx.MockTransport(lambda request: httpx.Response(status_code, stream=stream))
+    return CroutonClient(API_ROOT, transport=transport, async_transport=transport), stream
+
+
+ITEMS = [{"id": str(i), "mass": i + 0.5, "tags": ["a", "b"]} for i in range(20)]
+
+
+@pytest.mark.parametrize("items", [[], ITEMS[:1], ITEMS])
+def test_iter_get(items):
+    pytest.importorskip("ijson")
+    client, stream = streaming_client(200, json.dumps(items).encode())
+
+    received, read_before_first = [], None
+    for item in client.iter_get("potato"):
+        if not received:
+            read_before_first = stream.sent
+        received.append(item)
+
+    assert received == items
+    if len(items) > 1:
+        # The first item arrives before the whole body has been read
+        assert read_before_first < len(stream.chunks)
+
+
+@pytest.mark.parametrize("items", [[], ITEMS[:1], ITEMS])
+def test_aiter_get(items):
+    pytest.importorskip("ijson")
+    client, stream = streaming_client(200, json.dumps(items).encode())
+
+    async def collect():
+        return [item async for item in client.aiter_get("potato")]
+
+    assert asyncio.run(collect()) == items
+
+
+def test_iter_get_error_status():
+    pytest.importorskip("ijson")
+    client, _ = streaming_client(500, b'{"detail": "boom"}')
+
+    with pytest.raises(CroutonHTTPError) as exc_info:
+        list(client.iter_get("potato"))
+
+    assert exc_info.value.status_code == 500
+    assert "boom" in str(exc_info.value)
+
+
+def test_aiter_get_error_status():
+    pytest.importorskip("ijson")
+    client, _ = streaming_client(500, b'{"detail": "boom"}')
+
+    async def collect():
+        return [item async for item in client.aiter_get("potato")]
+
+    with pytest.raises(CroutonHTTPError) as exc_info:
+        asyncio.run(collect())
+
+    assert "boom" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("status_code", [200, 204])
+def test_iter_get_empty_body(status_code):
+    pytest.importorskip("ijson")
+    client, _ = streaming_client(status_code, b"")
+
+    async def collect():
+        return [item async for item in client.aiter_get("potato")]
+
+    assert list(client.iter_get("potato")) == []
+    assert asyncio.run(collect()) == []
+
+
+@pytest.mark.parametrize("body", [b'{"id": "1"}', b'        {"id": "1"}', b'"potato"'])
+def test_iter_get_not_an_array(body):
+    pytest.importorskip("ijson")
+    client, _ = streaming_client(200, body)
+
+    async def collect():
+        return [item async for item in client.aiter_get("potato")]
+
+    with pytest.raises(ValueError, match="JSON array"):
+        list(client.iter_get("potato"))
+    with pytest.raises(ValueError, match="JSON array"):
+        asyncio.run(collect())